@@ -1,19 +1,28 @@
-import os
+import builtins
+import concurrent.futures
+import functools
+from io import BytesIO
+import re
+import threading
+import time
+import types
+import symengine as se
 import sympy as sp
-import matplotlib.pyplot as plt
-from matplotlib.offsetbox import AnchoredText
+from sympy.printing.latex import LatexPrinter
+from sympy.parsing.sympy_parser import parse_expr, standard_transformations, convert_xor, implicit_application
+import matplotlib
+from matplotlib import mathtext
+from matplotlib.font_manager import FontProperties
 import pygame
 import pygame_gui
 
-# Project Directory
-Directory = os.path.abspath(os.path.dirname(__file__))
-SavePath = os.path.join(Directory, "Magic.png")
+# Render Settings (Built-In Mathtext Renderer, Not External LaTeX)
+matplotlib.rcParams['text.usetex'] = False
+matplotlib.rcParams['mathtext.fontset'] = 'cm'
 
 # Initialize GUI
+pygame.display.init()
 pygame.font.init()
-pygame.mixer.init()
-pygame.joystick.init()
-pygame.init()
 
 Width = pygame.display.Info().current_w
 Height = Width * (9 / 16)
@@ -21,17 +30,55 @@ SF = min(Width / 1920, Height / 1080)
 Window = pygame.display.set_mode((Width, Height))
 
 pygame.display.set_caption("EOM Solver GUI")
-pygame.mouse.set_pos((Width, Height))
 
 Manager = pygame_gui.UIManager((Width, Height))
 
 Clock = pygame.time.Clock()
 Running = False
 
+# Adaptive Frame Rate (Full Rate While Active, Reduced After Idle Delay)
+FrameRateActive = 60
+FrameRateIdle = 15
+IdleDelay = 0.5
+LastActiveTime = time.monotonic()
+LastMousePosition = None
+
+# Event Filter (Unhandled Types Dropped Before Reaching Python)
+EventTypes = [
+    pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+    pygame_gui.UI_BUTTON_PRESSED, pygame_gui.UI_BUTTON_DOUBLE_CLICKED,
+    pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE
+]
+pygame.event.set_blocked(None)
+pygame.event.set_allowed(EventTypes)
+
+# Background Worker (Keeps Event Loop Responsive; Daemon, So Exit Never Waits On It)
+Future = None
+
+def Submit(Function, *Arguments):
+    Result = concurrent.futures.Future()
+
+    def Run():
+        try:
+            Result.set_result(Function(*Arguments))
+        except BaseException as Error:
+            Result.set_exception(Error)
+
+    threading.Thread(target=Run, daemon=True).start()
+    return Result
+
+# Full Repaint (Startup and Window Exposure)
+def Repaint():
+    Window.blit(Background, (0, 0))
+    Manager.draw_ui(Window)
+    pygame.display.update()
+
 # Startup Function
 def Startup():
     global Running
     Running = True
+    Repaint()
 
 # Shutdown Function
 def Shutdown():
@@ -43,6 +90,32 @@ ColorBackground = '#36454F'
 ColorOutputFace = '#FFFFFF'
 ColorOutputEdge = '#000000'
 
+# Static Background (Repainted Only Beneath UI Elements)
+Background = pygame.Surface(Window.get_size()).convert()
+Background.fill(ColorBackground)
+
+# Sprite States From the Previous Frame (Image and Position)
+SpriteStates = {}
+
+def DirtyRects():
+    global SpriteStates
+    States = {Sprite: (Sprite.image, Sprite.rect.copy()) for Sprite in Manager.get_sprite_group().sprites()}
+    Rects = []
+    for Sprite, State in States.items():
+        Previous = SpriteStates.get(Sprite)
+        if Previous is None or State[0] is not Previous[0] or State[1] != Previous[1]:
+            Rects.append(State[1])
+            if Previous is not None:
+                Rects.append(Previous[1])
+    Rects.extend(Previous[1] for Sprite, Previous in SpriteStates.items() if Sprite not in States)
+    SpriteStates = States
+    return [Rect.clip(Window.get_rect()) for Rect in Rects]
+
+# Output Report (Rendered Line by Line, Shown In-Window)
+OutputFont = FontProperties(size=14, family="serif")
+OutputDPI = 100 * SF
+OutputImage = None
+
 # Input Fields and Buttons
 UserInputs = [
     {"type": "input", "name": "Constant", "pos": (50, 50), "size": (200, 30)},
@@ -65,13 +138,16 @@ UserInputs = [
     {"type": "button", "name": "RemoveKinetic", "pos": (740, 270), "size": (100, 30), "text": "- Kinetic"},
     {"type": "button", "name": "RemovePotential", "pos": (740, 380), "size": (100, 30), "text": "- Potential"},
 
-    {"type": "button", "name": "Generate", "pos": (50, 250), "size": (200, 40), "text": "Generate EOM"}
+    {"type": "button", "name": "Generate", "pos": (50, 250), "size": (200, 40), "text": "Generate EOM"},
+
+    {"type": "scroll", "name": "Output", "pos": (880, 50), "size": (990, 980)}
 ]
 
 # Initialize UI Elements
 InputFields = {}
 Buttons = {}
 SelectionLists = {}
+ScrollingContainers = {}
 
 for element in UserInputs:
     if element["type"] == "input":
@@ -80,161 +156,232 @@ for element in UserInputs:
         Buttons[element["name"]] = pygame_gui.elements.UIButton(relative_rect=pygame.Rect((element["pos"][0] * SF, element["pos"][1] * SF), (element["size"][0] * SF, element["size"][1] * SF)), text=element["text"], manager=Manager)
     elif element["type"] == "list":
         SelectionLists[element["name"]] = pygame_gui.elements.UISelectionList(relative_rect=pygame.Rect((element["pos"][0] * SF, element["pos"][1] * SF), (element["size"][0] * SF, element["size"][1] * SF)), item_list=[], manager=Manager)
+    elif element["type"] == "scroll":
+        ScrollingContainers[element["name"]] = pygame_gui.elements.UIScrollingContainer(relative_rect=pygame.Rect((element["pos"][0] * SF, element["pos"][1] * SF), (element["size"][0] * SF, element["size"][1] * SF)), manager=Manager)
 
 Constants, Variables, KineticEnergy, PotentialEnergy = [], [], [], []
 
-def SpecialCharacters(Symbol):
-    Characters = [
-        'Alpha', 'Beta', 'Gamma', 'Delta', 'Epsilon', 'Zeta', 'Eta', 'Theta', 'Iota', 'Kappa', 'Lambda', 'Mu', 'Nu', 'Xi', 'Omicron', 'Pi', 'Rho', 'Sigma', 'Tau', 'Upsilon', 'Phi', 'Chi', 'Psi', 'Omega',
-        'alpha', 'beta', 'gamma', 'delta', 'epsilon', 'zeta', 'eta', 'theta', 'iota', 'kappa', 'lambda', 'mu', 'nu', 'xi', 'omicron', 'pi', 'rho', 'sigma', 'tau', 'upsilon', 'phi', 'chi', 'psi', 'omega'
-    ]
-    for c in Characters:
-        if c in Symbol: Symbol = f'\\{Symbol}'; break
-    return Symbol
-
-def FormatExpression(Expression, Variables):
-    LatexString = sp.latex(sp.simplify(Expression))
-    LatexString = LatexString.replace(r'{\left(t \right)}', '')
-    LatexString = LatexString.replace(r'1.0', '')
-    LatexString = LatexString.replace(r'\cdot', '')
-    LatexString = LatexString.replace(r'\frac{d}{d t}', r'\dot')
-    LatexString = LatexString.replace(r'\frac{d^{2}}{d t^{2}}', r'\ddot')
-    for i, var in enumerate(Variables):
-        LatexString = LatexString.replace(f'q_{{{i+1}}}', str(var))
-        LatexString = LatexString.replace(f'\\dot{{q}}_{{{i+1}}}', f'\\dot{{{str(var)}}}')
-        LatexString = LatexString.replace(f'\\ddot{{q}}_{{{i+1}}}', f'\\ddot{{{str(var)}}}')
-    return LatexString
+InputMappings = {
+    InputFields["Constant"]: (Constants, SelectionLists["Constant"]),
+    InputFields["Variable"]: (Variables, SelectionLists["Variable"]),
+    InputFields["Kinetic"]: (KineticEnergy, SelectionLists["Kinetic"]),
+    InputFields["Potential"]: (PotentialEnergy, SelectionLists["Potential"]),
+}
 
-def GenerateImage(Constants, Variables, KineticEnergy, PotentialEnergy):
-    t = sp.symbols('t')
+ButtonMappings = {
+    Buttons["AddConstant"]: (Constants, SelectionLists["Constant"], InputFields["Constant"]),
+    Buttons["AddVariable"]: (Variables, SelectionLists["Variable"], InputFields["Variable"]),
+    Buttons["AddKinetic"]: (KineticEnergy, SelectionLists["Kinetic"], InputFields["Kinetic"]),
+    Buttons["AddPotential"]: (PotentialEnergy, SelectionLists["Potential"], InputFields["Potential"]),
+    Buttons["RemoveConstant"]: (Constants, SelectionLists["Constant"]),
+    Buttons["RemoveVariable"]: (Variables, SelectionLists["Variable"]),
+    Buttons["RemoveKinetic"]: (KineticEnergy, SelectionLists["Kinetic"]),
+    Buttons["RemovePotential"]: (PotentialEnergy, SelectionLists["Potential"]),
+}
 
-    q = sp.symbols(f'q1:{len(Variables)+1}', cls=sp.Function)
-    q_dot = [sp.diff(q_i(t), t) for q_i in q]
-    q_ddot = [sp.diff(qd, t) for qd in q_dot]
+Transformations = standard_transformations + (convert_xor, implicit_application)
 
-    SympyDict = {
-        **{f"{Variables[i]}": q[i](t) for i in range(len(q))},
-        **{f"{Variables[i]}_dot": q_dot[i] for i in range(len(q))},
-        **{f"{Variables[i]}_ddot": q_ddot[i] for i in range(len(q))},
+# Parser Namespace (Built Once; parse_expr Would Re-Import SymPy on Every Call)
+GlobalDict = {}
+exec('from sympy import *', GlobalDict)
+GlobalDict.update({name: obj for name, obj in vars(builtins).items() if isinstance(obj, types.BuiltinFunctionType)})
+GlobalDict['max'], GlobalDict['min'] = sp.Max, sp.Min
 
-        "sin": sp.sin, "cos": sp.cos, "tan": sp.tan,
-        "sec": sp.sec, "csc": sp.csc, "cot": sp.cot,
+SympyFunctions = {
+    "sin": sp.sin, "cos": sp.cos, "tan": sp.tan,
+    "sec": sp.sec, "csc": sp.csc, "cot": sp.cot,
 
-        "asin": sp.asin, "acos": sp.acos, "tan": sp.atan,
-        "asec": sp.asec, "acsc": sp.acsc, "cot": sp.acot,
+    "asin": sp.asin, "acos": sp.acos, "atan": sp.atan,
+    "asec": sp.asec, "acsc": sp.acsc, "acot": sp.acot,
 
-        "sinh": sp.sinh, "cosh": sp.cosh, "tanh": sp.tanh,
-        "sech": sp.sech, "csch": sp.csch, "coth": sp.coth,
+    "sinh": sp.sinh, "cosh": sp.cosh, "tanh": sp.tanh,
+    "sech": sp.sech, "csch": sp.csch, "coth": sp.coth,
 
-        "asinh": sp.asinh, "acosh": sp.acosh, "atanh": sp.atanh,
-        "asech": sp.asech, "acsch": sp.acsch, "acoth": sp.acoth,
+    "asinh": sp.asinh, "acosh": sp.acosh, "atanh": sp.atanh,
+    "asech": sp.asech, "acsch": sp.acsch, "acoth": sp.acoth,
 
-        "atan2": sp.atan2,
+    "atan2": sp.atan2,
 
-        "log": sp.log, "ln": sp.log,
+    "log": sp.log, "ln": sp.log,
+
+    "exp": sp.exp
+}
+
+GreekCharacters = re.compile('|'.join([
+    'Alpha', 'Beta', 'Gamma', 'Delta', 'Epsilon', 'Zeta', 'Eta', 'Theta', 'Iota', 'Kappa', 'Lambda', 'Mu', 'Nu', 'Xi', 'Omicron', 'Pi', 'Rho', 'Sigma', 'Tau', 'Upsilon', 'Phi', 'Chi', 'Psi', 'Omega',
+    'alpha', 'beta', 'gamma', 'delta', 'epsilon', 'zeta', 'eta', 'theta', 'iota', 'kappa', 'lambda', 'mu', 'nu', 'xi', 'omicron', 'pi', 'rho', 'sigma', 'tau', 'upsilon', 'phi', 'chi', 'psi', 'omega'
+]))
+
+@functools.lru_cache(maxsize=None)
+def SpecialCharacters(Symbol):
+    return f'\\{Symbol}' if GreekCharacters.search(Symbol) else Symbol
 
-        "exp": sp.exp,
+@functools.lru_cache(maxsize=None)
+def Simplify(Expression):
+    return sp.simplify(Expression._sympy_())
 
-        "^": '**'
+Printer = LatexPrinter({'fold_short_frac': False})
+
+CleanupTable = {
+    r'{\left(t \right)}': '',
+    r'1.0': '',
+    r'\cdot': '',
+    r'\frac{d}{d t}': r'\dot',
+    r'\frac{d^{2}}{d t^{2}}': r'\ddot'
+}
+CleanupPattern = re.compile('|'.join(map(re.escape, CleanupTable)))
+
+@functools.lru_cache(maxsize=None)
+def Latex(Expression):
+    return CleanupPattern.sub(lambda Match: CleanupTable[Match.group(0)], Printer.doprint(Expression))
+
+CoordinatePattern = re.compile(r'\\ddot\{q\}_\{\d+\}|\\dot\{q\}_\{\d+\}|q_\{\d+\}')
+
+def CoordinateTable(Variables):
+    Table = {}
+    for i, var in enumerate(Variables):
+        Table[f'q_{{{i+1}}}'] = str(var)
+        Table[f'\\dot{{q}}_{{{i+1}}}'] = f'\\dot{{{str(var)}}}'
+        Table[f'\\ddot{{q}}_{{{i+1}}}'] = f'\\ddot{{{str(var)}}}'
+    return Table
+
+def FormatExpression(Expression, Table):
+    return CoordinatePattern.sub(lambda Match: Table.get(Match.group(0), Match.group(0)), Latex(Expression))
+
+Time = se.symbols('t')
+CoordinatePool, CoordinateDotPool, CoordinateDdotPool = [], [], []
+
+def GeneralizedCoordinates(Count):
+    while len(CoordinatePool) < Count:
+        CoordinatePool.append(se.Function(f'q{len(CoordinatePool)+1}')(Time))
+        CoordinateDotPool.append(se.diff(CoordinatePool[-1], Time))
+        CoordinateDdotPool.append(se.diff(CoordinateDotPool[-1], Time))
+    return CoordinatePool[:Count], CoordinateDotPool[:Count], CoordinateDdotPool[:Count]
+
+def RenderLine(Line):
+    Buffer = BytesIO()
+    mathtext.math_to_image(Line, Buffer, prop=OutputFont, dpi=OutputDPI, format="png")
+    return Buffer.getvalue()
+
+@functools.lru_cache(maxsize=8)
+def GenerateReport(Constants, Variables, KineticEnergy, PotentialEnergy):
+
+    t = Time
+    qt, q_dot, q_ddot = GeneralizedCoordinates(len(Variables))
+
+    SympyDict = SympyFunctions | {
+        **{f"{Variables[i]}": qt[i]._sympy_() for i in range(len(qt))},
+        **{f"{Variables[i]}_dot": q_dot[i]._sympy_() for i in range(len(qt))},
+        **{f"{Variables[i]}_ddot": q_ddot[i]._sympy_() for i in range(len(qt))}
     }
 
     Constants = [SpecialCharacters(c) for c in Constants]
     Variables = [SpecialCharacters(v) for v in Variables]
+    Table = CoordinateTable(Variables)
 
-    T = sum([sp.sympify(term, locals=SympyDict) for term in KineticEnergy])
-    V = sum([sp.sympify(term, locals=SympyDict) for term in PotentialEnergy])
+    T = se.sympify(sum([parse_expr(term, local_dict=SympyDict, global_dict=GlobalDict, transformations=Transformations) for term in KineticEnergy]))
+    V = se.sympify(sum([parse_expr(term, local_dict=SympyDict, global_dict=GlobalDict, transformations=Transformations) for term in PotentialEnergy]))
     L = T - V
 
-    fig, ax = plt.subplots(figsize=(12, 8))
-    fig.patch.set_alpha(0)
-    ax.set_facecolor("none")
-    ax.grid(visible=False)
-    ax.axis("off")
-
     Title = r'$\mathbf{Equation\ of\ Motion\ Solver\ }$' + f'({len(Variables)} DOF)\n'
 
     def Divider(length=len(Title)//2):
         return '\n' + '—' * length + '\n'
 
-    Text = Title
-    Text += Divider()
-    Text += f'\nGeneralized Coordinates: ' + r'$\left('
-    Text += ', '.join(Variables) + r'\right)$' + f'\n'
-    Text += f'\nConstants: ' + r'$\left('
-    Text += ', '.join(Constants) + r'\right)$' + f'\n'
-    Text += f"\nKinetic and Potential Energy:" + f'\n'
-    Text += f'\t' + r'$\mathcal{T} = $' + f'${FormatExpression(T, Variables)}$\n'
-    Text += f'\t' + r'$\mathcal{V} = $' + f'${FormatExpression(V, Variables)}$\n'
+    Parts = [Title]
+    Parts.append(Divider())
+    Parts.append(f'\nGeneralized Coordinates: ' + r'$\left(')
+    Parts.append(', '.join(Variables) + r'\right)$' + f'\n')
+    Parts.append(f'\nConstants: ' + r'$\left(')
+    Parts.append(', '.join(Constants) + r'\right)$' + f'\n')
+    Parts.append(f"\nKinetic and Potential Energy:" + f'\n')
+    Parts.append(f'\t' + r'$\mathcal{T} = $' + f'${FormatExpression(Simplify(T), Table)}$\n')
+    Parts.append(f'\t' + r'$\mathcal{V} = $' + f'${FormatExpression(Simplify(V), Table)}$\n')
 
-    Text += f'\nLagrangian:\n'
-    Text += f'\t' + r'$\mathcal{{L}} = \mathcal{{T}} - \mathcal{{V}} = $' + f'${FormatExpression(L, Variables)}$\n'
-    Text += Divider()
+    Parts.append(f'\nLagrangian:\n')
+    Parts.append(f'\t' + r'$\mathcal{{L}} = \mathcal{{T}} - \mathcal{{V}} = $' + f'${FormatExpression(Simplify(L), Table)}$\n')
+    Parts.append(Divider())
+
+    dL_dq_dot = se.Matrix([L]).jacobian(se.Matrix(q_dot))
+    dL_dq = se.Matrix([L]).jacobian(se.Matrix(qt))
+    d_dt_dL_dq_dot = dL_dq_dot.diff(t)
 
     EOM = []
     for i in range(len(Variables)):
-        qi = q[i](t)
-        qi_dot = q_dot[i]
-        qi_ddot = q_ddot[i]
+        dL_dqi_dot = dL_dq_dot[i]
+        dL_dqi = dL_dq[i]
+        d_dt_dL_dqi_dot = d_dt_dL_dq_dot[i]
 
-        dL_dqi_dot = sp.diff(L, qi_dot)
-        dL_dqi = sp.diff(L, qi)
-        d_dt_dL_dqi_dot = sp.diff(dL_dqi_dot, t)
+        dL_dqi_dot_simplified = Simplify(dL_dqi_dot)
+        dL_dqi_simplified = Simplify(dL_dqi)
+        d_dt_dL_dqi_dot_simplified = Simplify(d_dt_dL_dqi_dot)
 
-        EOM.append(sp.Eq(0, (d_dt_dL_dqi_dot - dL_dqi)))
+        EOM_simplified = sp.simplify(d_dt_dL_dqi_dot_simplified - dL_dqi_simplified)
+        EOM.append(sp.Eq(EOM_simplified, 0))
 
-        Text += f'\nFor $q_{i+1} = {Variables[i]}$:\n'
-        Text += f'\t$\\frac{{\\partial \\mathcal{{L}}}}{{\\partial \\dot{{{{q}}}}_{{{i+1}}}}} = {FormatExpression(dL_dqi_dot, Variables)}$\n'
-        Text += f'\t$\\frac{{\\partial \\mathcal{{L}}}}{{\\partial q_{{{i+1}}}}} = {FormatExpression(dL_dqi, Variables)}$\n'
-        Text += f'\t$\\frac{{d}}{{dt}}\\left(\\frac{{\\partial \\mathcal{{L}}}}{{\\partial \\dot{{{{q}}}}_{{{i+1}}}}}\\right) = {FormatExpression(d_dt_dL_dqi_dot, Variables)}$\n'
+        Parts.append(f'\nFor $q_{i+1} = {Variables[i]}$:\n')
+        Parts.append(f'\t$\\frac{{\\partial \\mathcal{{L}}}}{{\\partial \\dot{{{{q}}}}_{{{i+1}}}}} = {FormatExpression(dL_dqi_dot_simplified, Table)}$\n')
+        Parts.append(f'\t$\\frac{{\\partial \\mathcal{{L}}}}{{\\partial q_{{{i+1}}}}} = {FormatExpression(dL_dqi_simplified, Table)}$\n')
+        Parts.append(f'\t$\\frac{{d}}{{dt}}\\left(\\frac{{\\partial \\mathcal{{L}}}}{{\\partial \\dot{{{{q}}}}_{{{i+1}}}}}\\right) = {FormatExpression(d_dt_dL_dqi_dot_simplified, Table)}$\n')
 
-    Text += Divider()
-    Text += f'\n' + r'$\mathbf{Equations\ of\ Motion:\ }$'
-    Text += r'$\frac{d}{dt}\left(\frac{\partial \mathcal{L}}{\partial \dot{q}_i}\right) - \frac{\partial \mathcal{L}}{\partial q_{i}} = 0$' + f'\n'
+    Parts.append(Divider())
+    Parts.append(f'\n' + r'$\mathbf{Equations\ of\ Motion:\ }$')
+    Parts.append(r'$\frac{d}{dt}\left(\frac{\partial \mathcal{L}}{\partial \dot{q}_i}\right) - \frac{\partial \mathcal{L}}{\partial q_{i}} = 0$' + f'\n')
 
     for i in range(len(Variables)):
-        Text += f'\n\t' + r'$\left(' + f'{Variables[i]}' + r'\right)$: '
-        Text += f'${FormatExpression(sp.simplify(EOM[i]), Variables)}$\n'
-
-    Textbox = AnchoredText(Text, loc="center", prop=dict(size=14, family="serif"), frameon=True, pad=0.5, bbox_to_anchor=(0.5, 0.5), bbox_transform=ax.transAxes)
-    Textbox.patch.set_boxstyle("round,pad=0.5")
-    Textbox.patch.set_facecolor(ColorOutputFace)
-    Textbox.patch.set_edgecolor(ColorOutputEdge)
-    Textbox.patch.set_alpha(1.0)
-
-    ax.add_artist(Textbox)
-    plt.savefig(SavePath, bbox_inches="tight", dpi=300, transparent=True)
-
-    if os.name == "posix":
-        os.system(f'xdg-open "{SavePath}"')
-    elif os.name == "nt":
-        os.system(f'start "" "{SavePath}"')
+        Parts.append(f'\n\t' + r'$\left(' + f'{Variables[i]}' + r'\right)$: ')
+        Parts.append(f'${FormatExpression(EOM[i], Table)}$\n')
+
+    Text = ''.join(Parts)
+    Lines = []
+    for Line in Text.split('\n'):
+        Content = Line.lstrip('\t')
+        Lines.append((len(Line) - len(Content), RenderLine(Content) if Content else None))
+
+    return Lines
+
+def ShowReport(Lines):
+    global OutputImage
+    Pad = round(OutputFont.get_size_in_points() * OutputDPI / 72)
+    Rows = [(2 * Pad * Indent, pygame.image.load(BytesIO(PNG), "png").convert_alpha() if PNG else None) for Indent, PNG in Lines]
+
+    ReportWidth = max([Offset + Row.get_width() for Offset, Row in Rows if Row] + [0]) + 2 * Pad
+    ReportHeight = sum([Row.get_height() if Row else Pad for Offset, Row in Rows]) + 2 * Pad
+    Report = pygame.Surface((ReportWidth, ReportHeight)).convert()
+    Report.fill(ColorOutputFace)
+    pygame.draw.rect(Report, ColorOutputEdge, Report.get_rect(), 1)
+
+    y = Pad
+    for Offset, Row in Rows:
+        if Row:
+            Report.blit(Row, (Pad + Offset, y))
+        y += Row.get_height() if Row else Pad
+
+    if OutputImage is not None:
+        OutputImage.kill()
+    OutputImage = pygame_gui.elements.UIImage(relative_rect=Report.get_rect(), image_surface=Report, manager=Manager, container=ScrollingContainers["Output"])
+    ScrollingContainers["Output"].set_scrollable_area_dimensions(Report.get_size())
 
 Startup()
 
 while Running:
-    TimeDelta = Clock.tick(60) / 1000.0
-    InputMappings = {
-        InputFields["Constant"]: (Constants, SelectionLists["Constant"]),
-        InputFields["Variable"]: (Variables, SelectionLists["Variable"]),
-        InputFields["Kinetic"]: (KineticEnergy, SelectionLists["Kinetic"]),
-        InputFields["Potential"]: (PotentialEnergy, SelectionLists["Potential"]),
-    }
+    FrameRate = FrameRateActive if time.monotonic() - LastActiveTime < IdleDelay else FrameRateIdle
+    TimeDelta = Clock.tick(FrameRate) / 1000.0
 
-    ButtonMappings = {
-        Buttons["AddConstant"]: (Constants, SelectionLists["Constant"], InputFields["Constant"]),
-        Buttons["AddVariable"]: (Variables, SelectionLists["Variable"], InputFields["Variable"]),
-        Buttons["AddKinetic"]: (KineticEnergy, SelectionLists["Kinetic"], InputFields["Kinetic"]),
-        Buttons["AddPotential"]: (PotentialEnergy, SelectionLists["Potential"], InputFields["Potential"]),
-        Buttons["RemoveConstant"]: (Constants, SelectionLists["Constant"]),
-        Buttons["RemoveVariable"]: (Variables, SelectionLists["Variable"]),
-        Buttons["RemoveKinetic"]: (KineticEnergy, SelectionLists["Kinetic"]),
-        Buttons["RemovePotential"]: (PotentialEnergy, SelectionLists["Potential"]),
-    }
+    # Activity: Queued Events, Mouse Movement (Hover), or Pending Generation
+    Events = pygame.event.get(EventTypes)
+    MousePosition = pygame.mouse.get_pos()
+    if Events or MousePosition != LastMousePosition or Future is not None:
+        LastActiveTime = time.monotonic()
+    LastMousePosition = MousePosition
 
-    for event in pygame.event.get():
+    for event in Events:
         if event.type == pygame.QUIT:
             Shutdown()
 
+        if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+            Repaint()
+
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_RETURN:
                 FocusedElements = Manager.get_focus_set()
@@ -265,11 +412,22 @@ while Running:
                         ListWidget.set_item_list(DataList)
 
             elif event.ui_element == Buttons["Generate"]:
-                GenerateImage(Constants, Variables, KineticEnergy, PotentialEnergy)
+                if Future is None or Future.done():
+                    Future = Submit(GenerateReport, tuple(Constants), tuple(Variables), tuple(KineticEnergy), tuple(PotentialEnergy))
 
         Manager.process_events(event)
 
+    if Future is not None and Future.done():
+        ShowReport(Future.result())
+        Future = None
+
     Manager.update(TimeDelta)
-    Window.fill(ColorBackground)
-    Manager.draw_ui(Window)
-    pygame.display.update()
\ No newline at end of file
+    Rects = DirtyRects()
+    for Rect in Rects:
+        Window.set_clip(Rect)
+        Window.blit(Background, Rect, Rect)
+        Manager.draw_ui(Window)
+    Window.set_clip(None)
+    pygame.display.update(Rects)
+
+pygame.quit()
\ No newline at end of file
@@ -17,8 +17,19 @@
 # Libraries
 import matplotlib.pyplot as plt
 from matplotlib.offsetbox import AnchoredText
+import builtins
+import functools
 import os
+import re
+import types
+import symengine as se
 import sympy as sp
+from sympy.printing.latex import LatexPrinter
+from sympy.parsing.sympy_parser import parse_expr, standard_transformations, convert_xor, implicit_application
+
+# Plot Settings (Built-In Mathtext Renderer, Not External LaTeX)
+plt.rcParams['text.usetex'] = False
+plt.rcParams['mathtext.fontset'] = 'cm'
 
 # Project Directory
 Directory = os.path.abspath(os.path.dirname(__file__))
@@ -63,46 +74,62 @@ PotentialEnergy = [
 ''' ------------- '''
 
 # Time
-t = sp.symbols('t')
+t = se.symbols('t')
 
-# Generalized Coordinates
-q = sp.symbols(f'q1:{len(Variables)+1}', cls=sp.Function)
-q_dot = [sp.diff(q_i(t), t) for q_i in q]
-q_ddot = [sp.diff(qd, t) for qd in q_dot]
+# Generalized Coordinates (SymEngine)
+q = [se.Function(f'q{i+1}') for i in range(len(Variables))]
+qt = [q_i(t) for q_i in q]
+q_dot = [se.diff(qi, t) for qi in qt]
+q_ddot = [se.diff(qd, t) for qd in q_dot]
 
-# Sympy-ify Terms
+# Sympy-ify Terms (Parsed by SymPy, Differentiated by SymEngine)
 SympyDict = {
-    **{f"{Variables[i]}": q[i](t) for i in range(len(q))},
-    **{f"{Variables[i]}_dot": q_dot[i] for i in range(len(q))},
-    **{f"{Variables[i]}_ddot": q_ddot[i] for i in range(len(q))},
+    **{f"{Variables[i]}": qt[i]._sympy_() for i in range(len(q))},
+    **{f"{Variables[i]}_dot": q_dot[i]._sympy_() for i in range(len(q))},
+    **{f"{Variables[i]}_ddot": q_ddot[i]._sympy_() for i in range(len(q))},
 
     "sin": sp.sin,
     "cos": sp.cos,
     "tan": sp.tan,
     "sec": sp.sec,
     "csc": sp.csc,
-    "cot": sp.cot,
-
-    "^": '**'
+    "cot": sp.cot
 }
 
+# Parser Transformations    [x^2 -> x**2, cos x -> cos(x)]
+Transformations = standard_transformations + (convert_xor, implicit_application)
+
+# Parser Namespace (Built Once; parse_expr Would Re-Import SymPy on Every Call)
+GlobalDict = {}
+exec('from sympy import *', GlobalDict)
+GlobalDict.update({name: obj for name, obj in vars(builtins).items() if isinstance(obj, types.BuiltinFunctionType)})
+GlobalDict['max'], GlobalDict['min'] = sp.Max, sp.Min
+
 # LaTeX-ify Terms
+GreekCharacters = re.compile('|'.join([
+    'Alpha', 'Beta', 'Gamma', 'Delta', 'Epsilon', 'Zeta', 'Eta', 'Theta', 'Iota', 'Kappa', 'Lambda', 'Mu', 'Nu', 'Xi', 'Omicron', 'Pi', 'Rho', 'Sigma', 'Tau', 'Upsilon', 'Phi', 'Chi', 'Psi', 'Omega',
+    'alpha', 'beta', 'gamma', 'delta', 'epsilon', 'zeta', 'eta', 'theta', 'iota', 'kappa', 'lambda', 'mu', 'nu', 'xi', 'omicron', 'pi', 'rho', 'sigma', 'tau', 'upsilon', 'phi', 'chi', 'psi', 'omega'
+]))
+
+@functools.lru_cache(maxsize=None)
 def SpecialCharacters(Symbol):
-    Characters = [
-        'Alpha', 'Beta', 'Gamma', 'Delta', 'Epsilon', 'Zeta', 'Eta', 'Theta', 'Iota', 'Kappa', 'Lambda', 'Mu', 'Nu', 'Xi', 'Omicron', 'Pi', 'Rho', 'Sigma', 'Tau', 'Upsilon', 'Phi', 'Chi', 'Psi', 'Omega',
-        'alpha', 'beta', 'gamma', 'delta', 'epsilon', 'zeta', 'eta', 'theta', 'iota', 'kappa', 'lambda', 'mu', 'nu', 'xi', 'omicron', 'pi', 'rho', 'sigma', 'tau', 'upsilon', 'phi', 'chi', 'psi', 'omega'
-    ]
-    for c in Characters:
-        if c in Symbol: Symbol = f'\\{Symbol}'; break
-    return Symbol
+    return f'\\{Symbol}' if GreekCharacters.search(Symbol) else Symbol
 
 # Constants and Variables
 Constants = [SpecialCharacters(c) for c in Constants]
 Variables = [SpecialCharacters(v) for v in Variables]
 
+# Generalized Coordinate Substitutions
+CoordinateTable = {}
+for i in range(len(Variables)):
+    CoordinateTable[f'q_{{{i+1}}}'] = Variables[i]
+    CoordinateTable[f'\\dot{{q}}_{{{i+1}}}'] = f'\\dot{{{Variables[i]}}}'
+    CoordinateTable[f'\\ddot{{q}}_{{{i+1}}}'] = f'\\ddot{{{Variables[i]}}}'
+CoordinatePattern = re.compile(r'\\ddot\{q\}_\{\d+\}|\\dot\{q\}_\{\d+\}|q_\{\d+\}')
+
 # Kinetic and Potential Energy
-T = sum([sp.sympify(term, locals=SympyDict) for term in KineticEnergy])
-V = sum([sp.sympify(term, locals=SympyDict) for term in PotentialEnergy])
+T = se.sympify(sum([parse_expr(term, local_dict=SympyDict, global_dict=GlobalDict, transformations=Transformations) for term in KineticEnergy]))
+V = se.sympify(sum([parse_expr(term, local_dict=SympyDict, global_dict=GlobalDict, transformations=Transformations) for term in PotentialEnergy]))
 
 # Lagrangian
 L = T - V
@@ -110,28 +137,35 @@ L = T - V
 # Equations of Motion
 EOM = []
 
-# Format LaTeX Expressions
-def Format(Expression):
-    # Remove Junk
-    LatexString = sp.latex(sp.simplify(Expression))                         # Simplify Expression                           [2x/4 -> x/2]
-    LatexString = LatexString.replace(r'{\left(t \right)}', '')             # Eliminate Function Notation                   [x(t) -> x]
-    LatexString = LatexString.replace(r'1.0', '')                           # Remove 1.0 Coefficient                        [1.0x -> x]
-    LatexString = LatexString.replace(r'\cdot', '')                         # Remove Multiplication Dot                     [x·y -> xy]
-    LatexString = LatexString.replace(r'\frac{d}{d t}', r'\dot')            # Replace 1st Time Derivative with Single Dot   [dx/dt -> x_dot]
-    LatexString = LatexString.replace(r'\frac{d^{2}}{d t^{2}}', r'\ddot')   # Replace 2nd Time Derivative with Double Dot   [d^2x/dt^2 -> x_ddot]
-
-    # Fix Parentheses
-    LatexString = LatexString.replace(r' (', ' \left(')
-    LatexString = LatexString.replace(r' )', ' \right)')
+# Simplify SymEngine Expression (Converted Back to SymPy, Memoized by Expression)
+@functools.lru_cache(maxsize=None)
+def Simplify(Expression):
+    return sp.simplify(Expression._sympy_())
+
+# LaTeX Printer (Shared Across Expressions)
+Printer = LatexPrinter({'fold_short_frac': False})
+
+# LaTeX Cleanup (Applied in a Single Pass)
+CleanupTable = {
+    r'{\left(t \right)}': '',                   # Eliminate Function Notation                   [x(t) -> x]
+    r'1.0': '',                                 # Remove 1.0 Coefficient                        [1.0x -> x]
+    r'\cdot': '',                               # Remove Multiplication Dot                     [x·y -> xy]
+    r'\frac{d}{d t}': r'\dot',                  # Replace 1st Time Derivative with Single Dot   [dx/dt -> x_dot]
+    r'\frac{d^{2}}{d t^{2}}': r'\ddot',         # Replace 2nd Time Derivative with Double Dot   [d^2x/dt^2 -> x_ddot]
+    r' (': r' \left(',                          # Fix Parentheses                               [( -> \left(]
+    r' )': r' \right)'                          # Fix Parentheses                               [) -> \right)]
+}
+CleanupPattern = re.compile('|'.join(map(re.escape, CleanupTable)))
 
-    # Replace Generalized Coordinates with Variable Names
-    for i in range(len(Variables)):
-        VariableString = str(Variables[i])
-        LatexString = LatexString.replace(f'q_{{{i+1}}}', VariableString)
-        LatexString = LatexString.replace(f'\\dot{{q}}_{{{i+1}}}', f'\\dot{{{VariableString}}}')
-        LatexString = LatexString.replace(f'\\ddot{{q}}_{{{i+1}}}', f'\\ddot{{{VariableString}}}')
+# LaTeX Rendering (Memoized by Expression)
+@functools.lru_cache(maxsize=None)
+def Latex(Expression):
+    return CleanupPattern.sub(lambda Match: CleanupTable[Match.group(0)], Printer.doprint(Expression))
 
-    return LatexString
+# Format LaTeX Expressions (Expects Simplified Expression)
+def Format(Expression):
+    # Replace Generalized Coordinates with Variable Names
+    return CoordinatePattern.sub(lambda Match: CoordinateTable.get(Match.group(0), Match.group(0)), Latex(Expression))
 
 # Initialize Plot
 fig, ax = plt.subplots(figsize=(12, 8))
@@ -145,77 +179,71 @@ ax.axis("off")
 Title = f'Equation of Motion Solver ({len(Variables)} DOF)\n'
 
 def Divider(Length=len(Title)):
-    Line = f'\n'
-    for i in range(Length): Line += '--'
-    Line += '\n'
-    return Line
+    return '\n' + '--' * Length + '\n'
 
-# Beginning Text
-Text = Title
+# Beginning Text (Collected in Parts, Joined Once)
+Parts = [Title]
 
-Text += Divider()
+Parts.append(Divider())
 
-Text += f'\nGeneralized Coordinates: ' + r'$\left('
-for i in range(len(Variables)):
-    Text += f'{Variables[i]}'
-    if i < len(Variables)-1: Text += f', '
-Text += r'\right)$' + f'\n'
+Parts.append(f'\nGeneralized Coordinates: ' + r'$\left(')
+Parts.append(', '.join(Variables) + r'\right)$' + f'\n')
 
-Text += f'\nConstants: ' + r'$\left('
-for i in range(len(Constants)):
-    Text += f'{Constants[i]}'
-    if i < len(Constants)-1: Text += f', '
-Text += r'\right)$' + f'\n'
+Parts.append(f'\nConstants: ' + r'$\left(')
+Parts.append(', '.join(Constants) + r'\right)$' + f'\n')
 
-Text += f"\nKinetic and Potential Energy:\n"
-Text += f'\t' + r'$\mathcal{T} = $' + f'${Format(T)}$\n'
-Text += f'\t' + r'$\mathcal{V} = $' + f'${Format(V)}$\n'
+Parts.append(f"\nKinetic and Potential Energy:\n")
+Parts.append(f'\t' + r'$\mathcal{T} = $' + f'${Format(Simplify(T))}$\n')
+Parts.append(f'\t' + r'$\mathcal{V} = $' + f'${Format(Simplify(V))}$\n')
 
-Text += f'\nLagrangian:\n'
-Text += f'\t' + r'$\mathcal{{L}} = \mathcal{{T}} - \mathcal{{V}} = $' + f'${Format(L)}$\n'
+Parts.append(f'\nLagrangian:\n')
+Parts.append(f'\t' + r'$\mathcal{{L}} = \mathcal{{T}} - \mathcal{{V}} = $' + f'${Format(Simplify(L))}$\n')
 
-Text += Divider()
+Parts.append(Divider())
 
-# For Each Generalized Coordinate:
-for i in range(len(Variables)):
-    # GC as a Function of Time
-    qi = q[i](t)
-
-    # First Time Derivative
-    qi_dot = q_dot[i]
+# (1) Partial L / Partial q_dot     [Gradient Over All Generalized Coordinates]
+dL_dq_dot = se.Matrix([L]).jacobian(se.Matrix(q_dot))
 
-    # Second Time Derivative
-    qi_ddot = q_ddot[i]
+# (2) Partial L / Partial q
+dL_dq = se.Matrix([L]).jacobian(se.Matrix(qt))
 
-    # (1) Partial L / Partial q_dot
-    dL_dqi_dot = (sp.diff(L, qi_dot))
+# (3) Time Derivative of (1)
+d_dt_dL_dq_dot = dL_dq_dot.diff(t)
 
-    # (2) Partial L / Partial q
-    dL_dqi = (sp.diff(L, qi))
+# For Each Generalized Coordinate:
+for i in range(len(Variables)):
+    # (1), (2), (3) for This Coordinate
+    dL_dqi_dot = dL_dq_dot[i]
+    dL_dqi = dL_dq[i]
+    d_dt_dL_dqi_dot = d_dt_dL_dq_dot[i]
 
-    # (3) Time Derivative of (1)
-    d_dt_dL_dqi_dot = (sp.diff(dL_dqi_dot, t))
+    # Simplified (1), (2), (3)
+    dL_dqi_dot_simplified = Simplify(dL_dqi_dot)
+    dL_dqi_simplified = Simplify(dL_dqi)
+    d_dt_dL_dqi_dot_simplified = Simplify(d_dt_dL_dqi_dot)
 
-    # (3) - (2) = 0
-    EOM.append(sp.Eq(0, (d_dt_dL_dqi_dot - dL_dqi)))
+    # (3) - (2) = 0     [Assembled from Simplified Components]
+    EOM_simplified = sp.simplify(d_dt_dL_dqi_dot_simplified - dL_dqi_simplified)
+    EOM.append(sp.Eq(EOM_simplified, 0))
 
     # Case-Specific Text
-    Text += f'\nFor $q_{i+1} = {Variables[i]}$:\n'
-    Text += f'\t$\\frac{{\\partial \\mathcal{{L}}}}{{\\partial \\dot{{{{q}}}}_{{{i+1}}}}} = {Format(dL_dqi_dot)}$\n'
-    Text += f'\t$\\frac{{\\partial \\mathcal{{L}}}}{{\\partial q_{{{i+1}}}}} = {Format(dL_dqi)}$\n'
-    Text += f'\t$\\frac{{d}}{{dt}}\\left(\\frac{{\\partial \\mathcal{{L}}}}{{\\partial \\dot{{{{q}}}}_{{{i+1}}}}}\\right) = {Format(d_dt_dL_dqi_dot)}$\n'
+    Parts.append(f'\nFor $q_{i+1} = {Variables[i]}$:\n')
+    Parts.append(f'\t$\\frac{{\\partial \\mathcal{{L}}}}{{\\partial \\dot{{{{q}}}}_{{{i+1}}}}} = {Format(dL_dqi_dot_simplified)}$\n')
+    Parts.append(f'\t$\\frac{{\\partial \\mathcal{{L}}}}{{\\partial q_{{{i+1}}}}} = {Format(dL_dqi_simplified)}$\n')
+    Parts.append(f'\t$\\frac{{d}}{{dt}}\\left(\\frac{{\\partial \\mathcal{{L}}}}{{\\partial \\dot{{{{q}}}}_{{{i+1}}}}}\\right) = {Format(d_dt_dL_dqi_dot_simplified)}$\n')
 
-Text += Divider()
+Parts.append(Divider())
 
 # Display EOMs
-Text += f'\nEquations of Motion: '
-Text += r'$\frac{d}{dt}\left(\frac{\partial \mathcal{L}}{\partial \dot{q}_i}\right) - \frac{\partial \mathcal{L}}{\partial q_{i}} = 0$' + f'\n'
+Parts.append(f'\nEquations of Motion: ')
+Parts.append(r'$\frac{d}{dt}\left(\frac{\partial \mathcal{L}}{\partial \dot{q}_i}\right) - \frac{\partial \mathcal{L}}{\partial q_{i}} = 0$' + f'\n')
 
 for i in range(len(Variables)):
-    Text += f'\n\t' + r'$\left(' + f'{Variables[i]}' + r'\right)$: '
-    Text += f'${Format(sp.simplify(EOM[i]))}$\n'
+    Parts.append(f'\n\t' + r'$\left(' + f'{Variables[i]}' + r'\right)$: ')
+    Parts.append(f'${Format(EOM[i])}$\n')
 
 # Text Box
+Text = ''.join(Parts)
 Textbox = AnchoredText(Text, loc="center", prop=dict(size=14, family="serif"), frameon=True, pad=0.5, bbox_to_anchor=(0.5, 0.5), bbox_transform=ax.transAxes)
 Textbox.patch.set_boxstyle("round,pad=0.5")
 Textbox.patch.set_facecolor("#ffffff")
@@ -224,8 +252,9 @@ Textbox.patch.set_alpha(1.0)
 
 ax.add_artist(Textbox)
 
-# Save Figure
-plt.savefig(SavePath, bbox_inches="tight", dpi=300, transparent=True)
+# Save Figure (Cropped to Measured Text Box, Avoids Extra Tight-Layout Render Pass)
+Bounds = Textbox.get_window_extent(fig.canvas.get_renderer()).transformed(fig.dpi_scale_trans.inverted())
+fig.savefig(SavePath, bbox_inches=Bounds.padded(0.1), dpi=150, transparent=True)
 
 # Open Figure
 if os.name == "posix": os.system(f'xdg-open "{SavePath}"')